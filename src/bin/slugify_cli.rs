@@ -1,5 +1,5 @@
 use std::env;
-use std::io::{self, Read};
+use std::io::{self, BufRead, BufWriter, Read, Write};
 
 #[allow(dead_code)]
 fn bool_from_env(key: &str, default: bool) -> bool {
@@ -41,7 +41,81 @@ fn read_input<R: Read>(r: &mut R) -> io::Result<String> {
     Ok(input.trim_end_matches('\n').to_string())
 }
 
+/// Split a `--batch` record into inline option overrides and the input text.
+///
+/// Records look like `KEY=VALUE\x1fKEY=VALUE\tTEXT`, using the same keys as
+/// the environment variables. A line without a tab is plain text slugified
+/// with the process-level options.
+fn parse_batch_line(line: &str) -> (Vec<(String, String)>, &str) {
+    match line.split_once('\t') {
+        Some((opts, text)) => {
+            let overrides = opts
+                .split('\x1f')
+                .filter_map(|pair| pair.split_once('='))
+                .map(|(k, v)| (k.to_string(), v.to_string()))
+                .collect();
+            (overrides, text)
+        }
+        None => (Vec::new(), line),
+    }
+}
+
+/// Slugify one record per input line and write one slug per output line.
+///
+/// A record that fails to build options is reported on stderr and produces an
+/// empty output line so results stay aligned with inputs. Returns the number
+/// of failed records.
+fn run_batch<R: BufRead, W: Write>(
+    base_env: &StdHashMap<String, String>,
+    input: R,
+    out: &mut W,
+) -> io::Result<usize> {
+    let mut failures = 0;
+    for line in input.lines() {
+        let line = line?;
+        let (overrides, text) = parse_batch_line(&line);
+        let result = if overrides.is_empty() {
+            run_with_env_map(base_env, text)
+        } else {
+            let mut env_map = base_env.clone();
+            env_map.extend(overrides);
+            run_with_env_map(&env_map, text)
+        };
+        match result {
+            Ok(slug) => writeln!(out, "{}", slug)?,
+            Err(e) => {
+                eprintln!("{}", e);
+                failures += 1;
+                writeln!(out)?;
+            }
+        }
+    }
+    out.flush()?;
+    Ok(failures)
+}
+
 fn main() {
+    // Build an env map from current process env
+    let mut env_map = StdHashMap::new();
+    for (k, v) in std::env::vars() {
+        env_map.insert(k, v);
+    }
+
+    // `--batch`: long-lived mode that processes one record per stdin line so
+    // callers can feed many inputs through a single process.
+    if env::args().skip(1).any(|a| a == "--batch") {
+        let stdout = io::stdout();
+        let mut out = BufWriter::new(stdout.lock());
+        match run_batch(&env_map, io::stdin().lock(), &mut out) {
+            Ok(0) => return,
+            Ok(_) => std::process::exit(2),
+            Err(e) => {
+                eprintln!("batch failed: {}", e);
+                std::process::exit(2);
+            }
+        }
+    }
+
     // Read stdin via a small testable helper
     let text = match read_input(&mut io::stdin()) {
         Ok(s) => s,
@@ -51,12 +125,6 @@ fn main() {
         }
     };
 
-    // Build an env map from current process env
-    let mut env_map = StdHashMap::new();
-    for (k, v) in std::env::vars() {
-        env_map.insert(k, v);
-    }
-
     match run_with_env_map(&env_map, &text) {
         Ok(out) => println!("{}", out),
         Err(e) => {
@@ -400,6 +468,37 @@ mod tests {
     assert!(!out2.trim().is_empty());
     }
 
+    #[test]
+    fn test_parse_batch_line_with_and_without_options() {
+        let (opts, text) =
+            super::parse_batch_line("SEPARATOR=_\x1fREPLACEMENTS=|=>or\tHello | World");
+        assert_eq!(
+            opts,
+            vec![
+                ("SEPARATOR".to_string(), "_".to_string()),
+                ("REPLACEMENTS".to_string(), "|=>or".to_string()),
+            ]
+        );
+        assert_eq!(text, "Hello | World");
+
+        let (opts2, text2) = super::parse_batch_line("plain text");
+        assert!(opts2.is_empty());
+        assert_eq!(text2, "plain text");
+    }
+
+    #[test]
+    fn test_run_batch_outputs_one_slug_per_line() {
+        use std::collections::HashMap as StdHashMap;
+
+        let base = StdHashMap::new();
+        let input = "C'est déjà l'été.\nSEPARATOR=_\tHello World\nREGEX_PATTERN=(?\tbad\n";
+        let mut out = Vec::new();
+        let failures = super::run_batch(&base, input.as_bytes(), &mut out).expect("batch failed");
+        assert_eq!(failures, 1);
+        let lines: Vec<&str> = std::str::from_utf8(&out).unwrap().lines().collect();
+        assert_eq!(lines, vec!["c-est-deja-l-ete", "hello_world", ""]);
+    }
+
     #[test]
     fn test_bin_path_basic() {
         // Do not mutate the process environment; just ensure the returned
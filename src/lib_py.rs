@@ -1,28 +1,17 @@
 use pyo3::prelude::*;
+use pyo3::types::PyFrozenSet;
 use pyo3::wrap_pyfunction;
+use rayon::prelude::*;
 
 use crate::slugify as slugify_mod;
 
-#[pyfunction]
+/// Minimum number of inputs handed to a Rayon worker in `slugify_many`.
+const PARALLEL_MIN_LEN: usize = 64;
+
+/// Build `SlugifyOptions` from the keyword arguments shared by every Python
+/// entry point. Invalid regex patterns are surfaced as `ValueError`.
 #[allow(clippy::too_many_arguments)]
-#[pyo3(signature=(
-    text,
-    entities=true,
-    decimal=false,
-    hexadecimal=false,
-    max_length=0,
-    word_boundary=true,
-    separator=None,
-    save_order=false,
-    stopwords=None,
-    regex_pattern=None,
-    lowercase=true,
-    replacements=None,
-    allow_unicode=false,
-    transliterate_icons=true
-))]
-fn slugify(
-    text: &str,
+fn build_options(
     entities: bool,
     decimal: bool,
     hexadecimal: bool,
@@ -36,7 +25,7 @@ fn slugify(
     replacements: Option<Vec<(String, String)>>,
     allow_unicode: bool,
     transliterate_icons: bool,
-) -> PyResult<String> {
+) -> PyResult<slugify_mod::SlugifyOptions> {
     let sep = separator.unwrap_or(slugify_mod::DEFAULT_SEPARATOR);
 
     let stop_vec: Vec<String> = stopwords.unwrap_or_default();
@@ -48,12 +37,8 @@ fn slugify(
         .map(|(a, b)| (a.as_str(), b.as_str()))
         .collect();
 
-    // The core Rust API does not currently support an explicit
-    // `transliterate_icons` flag. We pass the supported parameters
-    // to `slugify` and ignore `transliterate_icons` here to retain
-    // compatibility with the Python tests which may pass it.
-    // Build SlugifyOptions using the ergonomic builder API and call the
-    // options-based public function.
+    // Build SlugifyOptions using the ergonomic builder API so the regex is
+    // compiled once per call (or once per batch for `slugify_many`).
     let builder = slugify_mod::SlugifyOptions::builder()
         .entities(entities)
         .decimal(decimal)
@@ -71,15 +56,282 @@ fn slugify(
     // to the Rust options builder.
     let builder = builder.transliterate_icons(transliterate_icons);
 
-    let opts = builder
+    builder
         .build()
-        .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("invalid args: {:?}", e)))?;
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("invalid args: {:?}", e)))
+}
+
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+#[pyo3(signature=(
+    text,
+    entities=true,
+    decimal=false,
+    hexadecimal=false,
+    max_length=0,
+    word_boundary=true,
+    separator=None,
+    save_order=false,
+    stopwords=None,
+    regex_pattern=None,
+    lowercase=true,
+    replacements=None,
+    allow_unicode=false,
+    transliterate_icons=true
+))]
+fn slugify(
+    text: &str,
+    entities: bool,
+    decimal: bool,
+    hexadecimal: bool,
+    max_length: usize,
+    word_boundary: bool,
+    separator: Option<&str>,
+    save_order: bool,
+    stopwords: Option<Vec<String>>,
+    regex_pattern: Option<String>,
+    lowercase: bool,
+    replacements: Option<Vec<(String, String)>>,
+    allow_unicode: bool,
+    transliterate_icons: bool,
+) -> PyResult<String> {
+    let opts = build_options(
+        entities,
+        decimal,
+        hexadecimal,
+        max_length,
+        word_boundary,
+        separator,
+        save_order,
+        stopwords,
+        regex_pattern,
+        lowercase,
+        replacements,
+        allow_unicode,
+        transliterate_icons,
+    )?;
+
+    Ok(slugify_mod::slugify_with_options_public(&opts, text))
+}
+
+/// Slugify UTF-8 encoded `bytes`.
+///
+/// Same options as `slugify`, but the input is borrowed straight from the
+/// Python `bytes` buffer instead of going through `str` extraction. Callers
+/// that already hold encoded data can skip the `str` round-trip. Invalid
+/// UTF-8 raises `ValueError`.
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+#[pyo3(signature=(
+    data,
+    entities=true,
+    decimal=false,
+    hexadecimal=false,
+    max_length=0,
+    word_boundary=true,
+    separator=None,
+    save_order=false,
+    stopwords=None,
+    regex_pattern=None,
+    lowercase=true,
+    replacements=None,
+    allow_unicode=false,
+    transliterate_icons=true
+))]
+fn slugify_bytes(
+    data: &[u8],
+    entities: bool,
+    decimal: bool,
+    hexadecimal: bool,
+    max_length: usize,
+    word_boundary: bool,
+    separator: Option<&str>,
+    save_order: bool,
+    stopwords: Option<Vec<String>>,
+    regex_pattern: Option<String>,
+    lowercase: bool,
+    replacements: Option<Vec<(String, String)>>,
+    allow_unicode: bool,
+    transliterate_icons: bool,
+) -> PyResult<String> {
+    let text = std::str::from_utf8(data)
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("invalid utf-8: {}", e)))?;
+    let opts = build_options(
+        entities,
+        decimal,
+        hexadecimal,
+        max_length,
+        word_boundary,
+        separator,
+        save_order,
+        stopwords,
+        regex_pattern,
+        lowercase,
+        replacements,
+        allow_unicode,
+        transliterate_icons,
+    )?;
 
     Ok(slugify_mod::slugify_with_options_public(&opts, text))
 }
 
+/// Slugify a list of strings with a single set of options.
+///
+/// Keyword arguments are parsed and the options (including any regex) are
+/// built once for the whole batch, then every input is processed in Rust
+/// with the GIL released. This avoids paying the per-call argument parsing
+/// cost when slugifying many strings. With `parallel=True` the inputs are
+/// spread across the Rayon thread pool.
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+#[pyo3(signature=(
+    texts,
+    entities=true,
+    decimal=false,
+    hexadecimal=false,
+    max_length=0,
+    word_boundary=true,
+    separator=None,
+    save_order=false,
+    stopwords=None,
+    regex_pattern=None,
+    lowercase=true,
+    replacements=None,
+    allow_unicode=false,
+    transliterate_icons=true,
+    parallel=false
+))]
+fn slugify_many(
+    py: Python<'_>,
+    texts: Vec<String>,
+    entities: bool,
+    decimal: bool,
+    hexadecimal: bool,
+    max_length: usize,
+    word_boundary: bool,
+    separator: Option<&str>,
+    save_order: bool,
+    stopwords: Option<Vec<String>>,
+    regex_pattern: Option<String>,
+    lowercase: bool,
+    replacements: Option<Vec<(String, String)>>,
+    allow_unicode: bool,
+    transliterate_icons: bool,
+    parallel: bool,
+) -> PyResult<Vec<String>> {
+    let opts = build_options(
+        entities,
+        decimal,
+        hexadecimal,
+        max_length,
+        word_boundary,
+        separator,
+        save_order,
+        stopwords,
+        regex_pattern,
+        lowercase,
+        replacements,
+        allow_unicode,
+        transliterate_icons,
+    )?;
+
+    Ok(py.detach(|| {
+        if parallel {
+            // Slugs are short: keep a minimum chunk so scheduling overhead
+            // does not dominate the per-item work.
+            texts
+                .par_iter()
+                .with_min_len(PARALLEL_MIN_LEN)
+                .map(|t| slugify_mod::slugify_with_options_public(&opts, t))
+                .collect()
+        } else {
+            texts
+                .iter()
+                .map(|t| slugify_mod::slugify_with_options_public(&opts, t))
+                .collect()
+        }
+    }))
+}
+
+/// Pre-built slugify configuration.
+///
+/// Options are parsed and validated once in the constructor; `slug()` then
+/// only takes the input string, which keeps per-call argument parsing to a
+/// single positional argument.
+#[pyclass(frozen)]
+struct SlugifyConfig {
+    opts: slugify_mod::SlugifyOptions,
+}
+
+#[pymethods]
+impl SlugifyConfig {
+    #[new]
+    #[allow(clippy::too_many_arguments)]
+    #[pyo3(signature=(
+        entities=true,
+        decimal=false,
+        hexadecimal=false,
+        max_length=0,
+        word_boundary=true,
+        separator=None,
+        save_order=false,
+        stopwords=None,
+        regex_pattern=None,
+        lowercase=true,
+        replacements=None,
+        allow_unicode=false,
+        transliterate_icons=true
+    ))]
+    fn new(
+        entities: bool,
+        decimal: bool,
+        hexadecimal: bool,
+        max_length: usize,
+        word_boundary: bool,
+        separator: Option<&str>,
+        save_order: bool,
+        stopwords: Option<Vec<String>>,
+        regex_pattern: Option<String>,
+        lowercase: bool,
+        replacements: Option<Vec<(String, String)>>,
+        allow_unicode: bool,
+        transliterate_icons: bool,
+    ) -> PyResult<Self> {
+        let opts = build_options(
+            entities,
+            decimal,
+            hexadecimal,
+            max_length,
+            word_boundary,
+            separator,
+            save_order,
+            stopwords,
+            regex_pattern,
+            lowercase,
+            replacements,
+            allow_unicode,
+            transliterate_icons,
+        )?;
+        Ok(SlugifyConfig { opts })
+    }
+
+    /// Slugify `text` using the stored options.
+    fn slug(&self, text: &str) -> String {
+        slugify_mod::slugify_with_options_public(&self.opts, text)
+    }
+}
+
+/// Optional keyword arguments supported by this build, published to Python
+/// as the `FEATURES` frozenset so callers can test support without
+/// introspecting function signatures.
+const FEATURES: [&str; 3] = ["transliterate_icons", "allow_unicode", "word_boundary"];
+
 #[pymodule(name = "slugify_rs")]
-fn python_slugify_pi(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
+fn python_slugify_pi(py: Python, m: &Bound<PyModule>) -> PyResult<()> {
+    m.add("FEATURES", PyFrozenSet::new(py, FEATURES)?)?;
     m.add_function(wrap_pyfunction!(slugify, m)?)?;
+    m.add_function(wrap_pyfunction!(slugify_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(slugify_many, m)?)?;
+    m.add_class::<SlugifyConfig>()?;
     Ok(())
 }
@@ -337,7 +337,11 @@ fn slugify_with_options(input: &str, opts: &SlugifyOptions) -> String {
     // 6. Re-normalize and apply lowercase if requested
     let renormalized = normalize_text(&decoded_numeric, opts.allow_unicode, opts.transliterate_icons);
     let case_folded = if opts.lowercase {
-        renormalized.to_lowercase()
+        if renormalized.is_ascii() {
+            renormalized.to_ascii_lowercase()
+        } else {
+            renormalized.to_lowercase()
+        }
     } else {
         renormalized
     };
@@ -406,6 +410,11 @@ fn is_emoji(c: char) -> bool {
 }
 
 fn normalize_text(s: &str, allow_unicode: bool, transliterate_icons: bool) -> String {
+    // ASCII fast path: NFKC/NFKD and `deunicode` are identities on ASCII and
+    // no icon mapping applies, so the Unicode passes can be skipped entirely.
+    if s.is_ascii() {
+        return s.to_string();
+    }
     if allow_unicode {
         s.nfkc().collect()
     } else {
@@ -792,6 +801,16 @@ mod tests {
         assert!(s2.to_lowercase().contains("a"));
     }
 
+    #[test]
+    fn test_normalize_text_ascii_fast_path_matches_full_path() {
+        for s in ["Hello &amp; World -- 123", "", "a\tb_c'd", "&#x17D;"] {
+            let full: String = deunicode(&s.nfkd().collect::<String>());
+            assert_eq!(normalize_text(s, false, true), full);
+            assert_eq!(normalize_text(s, false, false), full);
+            assert_eq!(normalize_text(s, true, false), s.nfkc().collect::<String>());
+        }
+    }
+
     // Helper wrappers to call slugify with convenient defaults
 
     fn s_default(text: &str) -> String {
@@ -1,10 +1,11 @@
 import os
 import json
 import unicodedata
-import difflib
 import importlib
 import inspect
 import subprocess
+from dataclasses import dataclass, field
+from functools import lru_cache
 from shutil import which
 
 # imports for python-slugify and slugify-rs should be available in the test env
@@ -18,34 +19,71 @@ try:
 except Exception:
     slugify_rs = None
 
+# Resolve keyword support once at import time rather than per case.
+try:
+    _PY_SIG = inspect.signature(py_slugify)
+except (TypeError, ValueError):
+    _PY_SIG = None
+_PY_SUPPORTS_TRANSLIT = bool(_PY_SIG and 'transliterate_icons' in _PY_SIG.parameters)
+
+# The Rust binding publishes its supported options as `FEATURES`.
+_RS_SUPPORTS_TRANSLIT = 'transliterate_icons' in getattr(slugify_rs, 'FEATURES', ())
+
+# Compiled Rust CLI used when the Python binding is unavailable
+CLI_BIN_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'target', 'release', 'slugify_cli'))
+
+# Minimal environment for slugify_cli, built once: the CLI reads its options
+# from env vars, so per-case runs only add option keys on top of this.
+_BASE_ENV = {k: v for k, v in os.environ.items() if k in ('PATH', 'HOME', 'LANG', 'LC_ALL', 'USER', 'SYSTEMROOT')}
+
+# Outputs of `slugify_cli --batch`, keyed by batch record
+_CLI_CACHE: dict[str, str] = {}
+
 # Where we store goldens (python outputs)
 GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "goldens.json")
 
+
+@dataclass(slots=True, frozen=True)
+class Case:
+    """A single golden case: input text plus slugify keyword options."""
+
+    id: str
+    text: str
+    opts: dict = field(default_factory=dict)
+
+
 # Minimal representative cases and edge cases
 CASES = [
-    {"id": "accented", "text": "C'est déjà l'été.", "opts": {}},
-    {"id": "commas", "text": "1,000 reasons you are #1", "opts": {}},
-    {"id": "cyrillic", "text": "Компьютер", "opts": {}},
-    {"id": "emoji_drop", "text": "i love 🦄", "opts": {"allow_unicode": False}},
-    {"id": "emoji_keep", "text": "i love 🦄", "opts": {"allow_unicode": True, "regex_pattern": None}},
+    Case("accented", "C'est déjà l'été."),
+    Case("commas", "1,000 reasons you are #1"),
+    Case("cyrillic", "Компьютер"),
+    Case("emoji_drop", "i love 🦄", {"allow_unicode": False}),
+    Case("emoji_keep", "i love 🦄", {"allow_unicode": True, "regex_pattern": None}),
     # Icon transliteration cases: Python supports `transliterate_icons` kwarg; the
     # Rust binding/CLI may implement a different policy. We include both True and
     # False cases so the harness reports and documents divergences.
-    {"id": "icons_translit_false", "text": "I ♥ 🚀", "opts": {"transliterate_icons": False}},
-    {"id": "icons_translit_true", "text": "I ♥ 🚀", "opts": {"transliterate_icons": True}},
-    {"id": "entities", "text": "foo &amp; bar", "opts": {}},
-    {"id": "numeric_dec", "text": "&#381;", "opts": {"entities": True, "decimal": True, "hexadecimal": True}},
-    {"id": "numeric_hex", "text": "&#x17D;", "opts": {"entities": True, "decimal": True, "hexadecimal": True}},
-    {"id": "custom_replacements", "text": "10 | 20 %", "opts": {"replacements": [("|", "or"), ("%", "percent")]}},
-    {"id": "word_boundary", "text": "one two three four five", "opts": {"max_length": 12, "word_boundary": True}},
+    Case("icons_translit_false", "I ♥ 🚀", {"transliterate_icons": False}),
+    Case("icons_translit_true", "I ♥ 🚀", {"transliterate_icons": True}),
+    Case("entities", "foo &amp; bar"),
+    Case("numeric_dec", "&#381;", {"entities": True, "decimal": True, "hexadecimal": True}),
+    Case("numeric_hex", "&#x17D;", {"entities": True, "decimal": True, "hexadecimal": True}),
+    Case("custom_replacements", "10 | 20 %", {"replacements": [("|", "or"), ("%", "percent")]}),
+    Case("word_boundary", "one two three four five", {"max_length": 12, "word_boundary": True}),
 ]
 
 
+@lru_cache(maxsize=1024)
+def _nfkc(s: str) -> str:
+    return unicodedata.normalize("NFKC", s)
+
+
 def normalize(s: str) -> str:
-    if s is None:
+    if not s:
         return ""
-    s = unicodedata.normalize("NFKC", s)
-    return s.strip()
+    # NFKC is the identity on ASCII; skip the Unicode table lookups.
+    if s.isascii():
+        return s.strip()
+    return _nfkc(s).strip()
 
 
 def run_case_py(text: str, opts: dict) -> tuple[str, bool]:
@@ -57,13 +95,8 @@ def run_case_py(text: str, opts: dict) -> tuple[str, bool]:
     if py_slugify is None:
         raise RuntimeError("python-slugify not importable; install the package in the test env")
     # If python-slugify doesn't accept `transliterate_icons`, drop it.
-    try:
-        sig = inspect.signature(py_slugify)
-    except (TypeError, ValueError):
-        sig = None
-
     translit_passed = False
-    if 'transliterate_icons' in kwargs and not (sig and 'transliterate_icons' in sig.parameters):
+    if 'transliterate_icons' in kwargs and not _PY_SUPPORTS_TRANSLIT:
         # pop and ignore
         kwargs.pop('transliterate_icons')
         translit_passed = False
@@ -92,13 +125,8 @@ def run_case_rust(text: str, opts: dict) -> str:
         allow_unicode = opts.get("allow_unicode", False)
 
         # If the Python binding supports `transliterate_icons`, call with keyword arg.
-        try:
-            sig = inspect.signature(slugify_rs.slugify)
-        except (TypeError, ValueError):
-            sig = None
-
         translit = opts.get('transliterate_icons', False)
-        if sig and 'transliterate_icons' in sig.parameters:
+        if _RS_SUPPORTS_TRANSLIT:
             return slugify_rs.slugify(
                 text,
                 entities=entities,
@@ -119,49 +147,109 @@ def run_case_rust(text: str, opts: dict) -> str:
         # Fallback positional call for older bindings
         return slugify_rs.slugify(text, entities, decimal, hexadecimal, max_length, word_boundary, separator, save_order, stopwords, regex_pattern, lowercase, replacements, allow_unicode)
 
-    # Fallback: try to call compiled Rust CLI binary `slugify_cli` if present
-    bin_path = os.path.join(os.path.dirname(__file__), '..', 'target', 'release', 'slugify_cli')
-    bin_path = os.path.normpath(bin_path)
-    if which(bin_path) or os.path.exists(bin_path):
+    # Fallback: use the compiled Rust CLI binary `slugify_cli` if present.
+    # Cases primed through `prime_cli_cache` are served from the single
+    # `--batch` process; anything else spawns the binary once.
+    if os.path.exists(CLI_BIN_PATH) or which(CLI_BIN_PATH):
+        record = _cli_record(text, opts)
+        if record in _CLI_CACHE:
+            return _CLI_CACHE[record]
         # Prepare env vars to pass options to the CLI
-        env = os.environ.copy()
-        # mandatory flags (set always)
-        env['ENTITIES'] = str(int(opts.get('entities', True)))
-        env['DECIMAL'] = str(int(opts.get('decimal', True)))
-        env['HEXADECIMAL'] = str(int(opts.get('hexadecimal', True)))
-        env['MAX_LENGTH'] = str(opts.get('max_length', 0))
-        env['WORD_BOUNDARY'] = str(int(opts.get('word_boundary', False)))
-        env['SEPARATOR'] = opts.get('separator', '-')
-        env['SAVE_ORDER'] = str(int(opts.get('save_order', False)))
-        env['STOPWORDS'] = ','.join(opts.get('stopwords', []))
-        # optional fields: only set if provided to avoid sending an empty regex
-        if opts.get('regex_pattern') is not None:
-            env['REGEX_PATTERN'] = str(opts.get('regex_pattern'))
-        env['LOWERCASE'] = str(int(opts.get('lowercase', True)))
-        if opts.get('replacements'):
-            env['REPLACEMENTS'] = ';;'.join([f"{a}=>{b}" for (a, b) in opts.get('replacements', [])])
-        env['ALLOW_UNICODE'] = str(int(opts.get('allow_unicode', False)))
+        env = dict(_BASE_ENV)
+        env.update(_cli_options(opts))
         # call the binary with input text via stdin
-        proc = subprocess.run([bin_path], input=text.encode('utf-8'), stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+        proc = subprocess.run([CLI_BIN_PATH], input=text.encode('utf-8'), stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
         if proc.returncode != 0:
             raise RuntimeError(f"slugify_cli failed: {proc.stderr.decode('utf-8')}")
         out = proc.stdout.decode('utf-8').strip()
-        print(f"[golden_harness] used slugify_cli at {bin_path}; stdout='''{out}'''; stderr='''{proc.stderr.decode('utf-8')}'''")
+        print(f"[golden_harness] used slugify_cli at {CLI_BIN_PATH}; stdout='''{out}'''; stderr='''{proc.stderr.decode('utf-8')}'''")
         return out
 
     raise RuntimeError("slugify_rs binding not importable and slugify_cli binary not found; build with maturin develop or cargo build --release in this repo")
 
 
+def _cli_options(opts: dict) -> dict:
+    """Map harness options to the environment keys understood by slugify_cli."""
+    env = {}
+    # mandatory flags (set always)
+    env['ENTITIES'] = str(int(opts.get('entities', True)))
+    env['DECIMAL'] = str(int(opts.get('decimal', True)))
+    env['HEXADECIMAL'] = str(int(opts.get('hexadecimal', True)))
+    env['MAX_LENGTH'] = str(opts.get('max_length', 0))
+    env['WORD_BOUNDARY'] = str(int(opts.get('word_boundary', False)))
+    env['SEPARATOR'] = opts.get('separator', '-')
+    env['SAVE_ORDER'] = str(int(opts.get('save_order', False)))
+    env['STOPWORDS'] = ','.join(opts.get('stopwords', []))
+    # optional fields: only set if provided to avoid sending an empty regex
+    if opts.get('regex_pattern') is not None:
+        env['REGEX_PATTERN'] = str(opts.get('regex_pattern'))
+    env['LOWERCASE'] = str(int(opts.get('lowercase', True)))
+    if opts.get('replacements'):
+        env['REPLACEMENTS'] = ';;'.join([f"{a}=>{b}" for (a, b) in opts.get('replacements', [])])
+    env['ALLOW_UNICODE'] = str(int(opts.get('allow_unicode', False)))
+    return env
+
+
+def _cli_record(text: str, opts: dict) -> str:
+    """Encode one `slugify_cli --batch` record: `KEY=VALUE\\x1f...\\tTEXT`."""
+    options = '\x1f'.join(f"{k}={v}" for k, v in _cli_options(opts).items())
+    return f"{options}\t{text}"
+
+
+def _batchable(text: str, opts: dict) -> bool:
+    """Whether a case can be framed as a single `--batch` record."""
+    if '\n' in text or '\r' in text:
+        return False
+    return not any(
+        c in value
+        for value in _cli_options(opts).values()
+        for c in ('\t', '\x1f', '\n', '\r')
+    )
+
+
+def prime_cli_cache(cases) -> None:
+    """Slugify all `cases` through a single `slugify_cli --batch` process.
+
+    Only used when the Python binding is unavailable. Results are cached by
+    batch record so `run_case_rust` does not spawn the binary per case.
+    """
+    if slugify_rs is not None and hasattr(slugify_rs, 'slugify'):
+        return
+    if not (os.path.exists(CLI_BIN_PATH) or which(CLI_BIN_PATH)):
+        return
+    # One record per line: texts with line breaks, or option values with the
+    # record delimiters, cannot be framed and fall back to the per-case spawn.
+    records = [
+        _cli_record(case.text, case.opts)
+        for case in cases
+        if _batchable(case.text, case.opts)
+    ]
+    if not records:
+        return
+    payload = ''.join(f"{r}\n" for r in records).encode('utf-8')
+    proc = subprocess.run([CLI_BIN_PATH, '--batch'], input=payload, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=_BASE_ENV)
+    if proc.returncode != 0:
+        raise RuntimeError(f"slugify_cli --batch failed: {proc.stderr.decode('utf-8')}")
+    # Split on '\n' only: str.splitlines() also breaks on \x1c-\x1e, \x85, \u2028...
+    stdout = proc.stdout.decode('utf-8')
+    outs = stdout.removesuffix('\n').split('\n')
+    if len(outs) != len(records):
+        raise RuntimeError(f"slugify_cli --batch returned {len(outs)} lines for {len(records)} records")
+    _CLI_CACHE.update((r, o.strip()) for r, o in zip(records, outs))
+    print(f"[golden_harness] used slugify_cli --batch at {CLI_BIN_PATH} for {len(outs)} cases")
+
+
 def main(regen: bool = False):
     results = {}
     diffs = []
+    prime_cli_cache(CASES)
     for case in CASES:
-        text = case["text"]
-        opts = case.get("opts", {})
+        text = case.text
+        opts = case.opts
         gold, py_translit_used = run_case_py(text, opts)
         gold = normalize(gold)
         rust_out = normalize(run_case_rust(text, opts))
-        results[case["id"]] = {"input": text, "opts": opts, "gold": gold, "rust": rust_out}
+        results[case.id] = {"input": text, "opts": opts, "gold": gold, "rust": rust_out}
         # Special-case: if caller requested transliterate_icons but the
         # installed python-slugify didn't accept the kwarg, we allow
         # Rust to provide an enhanced transliteration. Accept the case
@@ -174,7 +262,7 @@ def main(regen: bool = False):
             if not py_translit_used and ('transliterate_icons' in opts):
                 if (gold in rust_out) or (rust_out in gold):
                     continue
-            diffs.append((case["id"], gold, rust_out))
+            diffs.append((case.id, gold, rust_out))
 
     if regen:
         # write goldens (python outputs)
@@ -189,8 +277,8 @@ def main(regen: bool = False):
         print("Found differences between python goldens and rust outputs:")
         for key, gold, rust in diffs:
             print(f"--- {key} ---")
-            for line in difflib.unified_diff(gold.splitlines(), rust.splitlines(), fromfile="gold", tofile="rust", lineterm=""):
-                print(line)
+            print(f"gold: {gold!r}")
+            print(f"rust: {rust!r}")
         return 2
 
     print("All cases matched")
@@ -0,0 +1,62 @@
+import pytest
+
+import python_slugify_pi
+
+TEXT = "Hello, Äpfel & Öl -- 123"
+INVALID_REGEX = "(?"
+
+
+def test_slugify_many_matches_slugify():
+    texts = [TEXT, "C'est déjà l'été.", ""]
+    out = python_slugify_pi.slugify_many(texts, separator="_")
+    assert out == [python_slugify_pi.slugify(t, separator="_") for t in texts]
+
+
+def test_slugify_many_parallel_preserves_order():
+    texts = [f"This is a test - {i} Äpfel & Öl" for i in range(300)]
+    assert python_slugify_pi.slugify_many(texts, parallel=True) == python_slugify_pi.slugify_many(texts)
+
+
+def test_slugify_many_empty_list():
+    assert python_slugify_pi.slugify_many([]) == []
+    assert python_slugify_pi.slugify_many([], parallel=True) == []
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_slugify_many_rejects_invalid_regex(parallel):
+    with pytest.raises(ValueError):
+        python_slugify_pi.slugify_many([TEXT], regex_pattern=INVALID_REGEX, parallel=parallel)
+
+
+def test_slugify_many_rejects_non_str_items():
+    with pytest.raises(TypeError):
+        python_slugify_pi.slugify_many([TEXT, 42])
+
+
+def test_slugify_config_matches_slugify():
+    cfg = python_slugify_pi.SlugifyConfig(separator="_", max_length=10)
+    assert cfg.slug(TEXT) == python_slugify_pi.slugify(TEXT, separator="_", max_length=10)
+
+
+def test_slugify_config_rejects_invalid_regex():
+    with pytest.raises(ValueError):
+        python_slugify_pi.SlugifyConfig(regex_pattern=INVALID_REGEX)
+
+
+def test_slugify_bytes_matches_slugify():
+    assert python_slugify_pi.slugify_bytes(TEXT.encode("utf-8")) == python_slugify_pi.slugify(TEXT)
+
+
+def test_slugify_bytes_rejects_invalid_utf8():
+    with pytest.raises(ValueError):
+        python_slugify_pi.slugify_bytes(b"\xff\xfe")
+
+
+def test_slugify_bytes_rejects_invalid_regex():
+    with pytest.raises(ValueError):
+        python_slugify_pi.slugify_bytes(TEXT.encode("utf-8"), regex_pattern=INVALID_REGEX)
+
+
+def test_features_constant():
+    assert isinstance(python_slugify_pi.FEATURES, frozenset)
+    assert "transliterate_icons" in python_slugify_pi.FEATURES
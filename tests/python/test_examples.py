@@ -1,4 +1,3 @@
-import inspect
 import pytest
 
 try:
@@ -12,6 +11,9 @@ try:
 except Exception as e:
     pytest.skip(f"Rust binding not available: {e}", allow_module_level=True)
 
+# Resolve keyword support once for all parametrized cases.
+_RS_SUPPORTS_TRANSLIT = "transliterate_icons" in getattr(python_slugify_pi, "FEATURES", ())
+
 EXAMPLES = [
     ("C'est déjà l'été.", {}),
     ("Компьютер", {}),
@@ -32,13 +34,12 @@ EXAMPLES = [
 ]
 
 
-@pytest.mark.parametrize("text,kwargs", EXAMPLES)
-def test_examples_match_python_and_rust(text, kwargs):
-    # Call python-slugify without the transliterate_icons kwarg
+def _prepare(text, kwargs):
+    """Split an example into (text, py_kwargs, rust_kwargs, translit)."""
+    # python-slugify is called without the transliterate_icons kwarg
     py_kwargs = {k: v for k, v in kwargs.items() if k != "transliterate_icons"}
-    py_out = py_slugify(text, **py_kwargs)
 
-    # Prepare rust kwargs and pop transliterate_icons to avoid duplicate passing
+    # Pop transliterate_icons from the rust kwargs to avoid duplicate passing
     rust_kwargs = kwargs.copy()
     translit = rust_kwargs.pop("transliterate_icons", False)
 
@@ -46,21 +47,28 @@ def test_examples_match_python_and_rust(text, kwargs):
         rust_kwargs["replacements"] = [
             (a, b) for (a, b) in rust_kwargs["replacements"]
         ]
+    if _RS_SUPPORTS_TRANSLIT:
+        rust_kwargs["transliterate_icons"] = translit
 
-    try:
-        sig = inspect.signature(rs_slugify)
-    except (TypeError, ValueError):
-        sig = None
+    return text, py_kwargs, rust_kwargs, translit
 
-    supports_translit = bool(sig and "transliterate_icons" in sig.parameters)
 
-    if supports_translit:
-        rs_out = rs_slugify(text, **rust_kwargs, transliterate_icons=translit)
-    else:
-        rs_out = rs_slugify(text, **rust_kwargs)
+# Built once at import so parametrized cases share the kwargs preparation.
+PREPARED = [_prepare(text, kwargs) for text, kwargs in EXAMPLES]
+
+
+@pytest.fixture(params=PREPARED, ids=[repr(text) for text, *_ in PREPARED])
+def example(request):
+    return request.param
+
+
+def test_examples_match_python_and_rust(example):
+    text, py_kwargs, rust_kwargs, translit = example
+    py_out = py_slugify(text, **py_kwargs)
+    rs_out = rs_slugify(text, **rust_kwargs)
 
     # If the binding supports transliterate_icons, assert parity when translit is False.
-    if supports_translit:
+    if _RS_SUPPORTS_TRANSLIT:
         if not translit:
             assert py_out == rs_out
         else: